@@ -0,0 +1,56 @@
+import orjson
+import redis.asyncio as redis
+from bson import ObjectId
+from redis.exceptions import RedisError
+
+from app.config import CACHE_TOMBSTONE_SECONDS, CACHE_TTL_SECONDS, REDIS_URL
+
+redis_client = redis.from_url(REDIS_URL) if REDIS_URL else None
+
+# Written in place of a document on update/delete. Cache writes only succeed
+# on an absent key, so a read that fetched the old document before the write
+# committed cannot put it back while the tombstone lives. A read slower than
+# CACHE_TOMBSTONE_SECONDS can still repopulate it, for at most the TTL
+TOMBSTONE = b""
+
+# Fetch a document by ID, serving it from Redis when cached
+async def cached_get(collection, obj_id: ObjectId, domain: str):
+    key = f"{domain}:{obj_id}"
+
+    if redis_client:
+        try:
+            raw = await redis_client.get(key)
+        except RedisError:
+            raw = None
+        if raw:
+            return orjson.loads(raw)
+
+    doc = await collection.find_one({"_id": obj_id})
+    if not doc:
+        return None
+
+    doc["_id"] = str(doc["_id"])
+    await cache_document(doc, domain)
+
+    return doc
+
+# Store a document whose _id is already a string, unless the key holds
+# a tombstone or a newer entry
+async def cache_document(doc: dict, domain: str):
+    if redis_client:
+        try:
+            await redis_client.set(
+                f"{domain}:{doc['_id']}", orjson.dumps(doc), ex=CACHE_TTL_SECONDS, nx=True
+            )
+        except RedisError:
+            pass
+
+# Tombstone a cached document after it was updated or deleted
+async def invalidate_cached(obj_id: ObjectId, domain: str):
+    if redis_client:
+        try:
+            await redis_client.set(
+                f"{domain}:{obj_id}", TOMBSTONE, ex=CACHE_TOMBSTONE_SECONDS
+            )
+        except RedisError:
+            pass
@@ -0,0 +1,25 @@
+import os
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Read the MongoDB URI from environment variables
+MONGO_URI = os.getenv("MONGO_URI")
+
+if not MONGO_URI:
+    raise RuntimeError("MONGO_URI is not set in .env file")
+
+# Connection pool per worker process. By default PyMongo's on-demand pool is
+# used; setting MONGO_POOL_SIZE pins it at that size, opened eagerly
+MONGO_POOL_SIZE = int(os.getenv("MONGO_POOL_SIZE")) if os.getenv("MONGO_POOL_SIZE") else None
+
+# Optional Redis read-through cache for single-document lookups
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_TTL_SECONDS = 300
+CACHE_TOMBSTONE_SECONDS = 10
+
+# Optional S3-compatible object storage for uploaded media; GridFS when unset
+S3_BUCKET = os.getenv("S3_BUCKET")
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL")
+S3_URL_EXPIRY_SECONDS = 3600
@@ -0,0 +1,42 @@
+import logging
+import motor.motor_asyncio
+from pymongo import ASCENDING
+from pymongo.errors import OperationFailure
+
+from app.config import MONGO_POOL_SIZE, MONGO_URI
+
+# A fixed-size pool fails fast when exhausted (mapped to 503 in app.main);
+# otherwise PyMongo's defaults apply and requests queue for a connection
+pool_options = {}
+if MONGO_POOL_SIZE:
+    pool_options = {
+        "minPoolSize": MONGO_POOL_SIZE,
+        "maxPoolSize": MONGO_POOL_SIZE,
+        "waitQueueTimeoutMS": 2000
+    }
+
+logger = logging.getLogger(__name__)
+
+# Connect to MongoDB Atlas
+client = motor.motor_asyncio.AsyncIOMotorClient(MONGO_URI, **pool_options)
+db = client.event_management_db
+
+# GridFS buckets for uploaded media
+event_posters = motor.motor_asyncio.AsyncIOMotorGridFSBucket(db, bucket_name="event_posters")
+promo_videos = motor.motor_asyncio.AsyncIOMotorGridFSBucket(db, bucket_name="promo_videos")
+venue_photos = motor.motor_asyncio.AsyncIOMotorGridFSBucket(db, bucket_name="venue_photos")
+
+# Indexes backing reference lookups and attendee email uniqueness
+async def create_indexes():
+    await db.events.create_index("venue_id")
+    await db.bookings.create_index([("event_id", ASCENDING), ("attendee_id", ASCENDING)])
+
+    # Data written before emails were unique may contain duplicates; that
+    # must not stop the API from starting
+    try:
+        await db.attendees.create_index("email", unique=True)
+    except OperationFailure as exc:
+        logger.warning(
+            "Unique index on attendees.email not created, "
+            "duplicate emails must be removed first: %s", exc
+        )
@@ -0,0 +1,42 @@
+from typing import Annotated, Optional
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import Body, Depends, HTTPException, Path, Query
+
+from app.helpers import to_object_id
+
+# Path parameter "<name>_id" parsed into an ObjectId once, at dependency resolution
+def object_id_path(name: str):
+    def parse_object_id(
+        id_str: Annotated[str, Path(alias=f"{name.lower()}_id")]
+    ) -> ObjectId:
+        try:
+            return to_object_id(id_str)
+        except InvalidId:
+            raise HTTPException(status_code=400, detail=f"Invalid {name.lower()} ID")
+
+    return Annotated[ObjectId, Depends(parse_object_id)]
+
+EventId = object_id_path("Event")
+VenueId = object_id_path("Venue")
+AttendeeId = object_id_path("Attendee")
+BookingId = object_id_path("Booking")
+FileId = object_id_path("File")
+
+# Keyset pagination cursor: the _id of the last document of the previous page
+def parse_cursor(after: Optional[str] = None) -> Optional[ObjectId]:
+    if after is None:
+        return None
+    try:
+        return to_object_id(after)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+PageCursor = Annotated[Optional[ObjectId], Depends(parse_cursor)]
+PageLimit = Annotated[int, Query(ge=1, le=100)]
+
+# Request body for bulk inserts: a non-empty list of at most 1000 items
+MAX_BULK_SIZE = 1000
+
+def bulk_body(model):
+    return Annotated[list[model], Body(min_length=1, max_length=MAX_BULK_SIZE)]
@@ -0,0 +1,125 @@
+from functools import lru_cache
+from typing import Optional
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+import orjson
+
+from app.responses import encode_bson_types
+
+# Parsed IDs are cached because hot endpoints see the same IDs repeatedly.
+# Only str input is accepted: ObjectId(None) would generate a new ID
+@lru_cache(maxsize=8192)
+def to_object_id(id_str: str) -> ObjectId:
+    if not isinstance(id_str, str):
+        raise TypeError(f"ID must be a string, not {type(id_str).__name__}")
+    return ObjectId(id_str)
+
+async def validate_object_id(id_str: str, collection, name: str):
+    try:
+        obj_id = to_object_id(id_str)
+    except:
+        raise HTTPException(status_code=400, detail=f"Invalid {name} ID format")
+    
+    # Only _id is projected, so the lookup is answered from the _id index
+    exists = await collection.find_one({"_id": obj_id}, projection={"_id": 1})
+    if not exists:
+        raise HTTPException(status_code=400, detail=f"{name} not found")
+    
+    return obj_id
+
+# Validate several (id_str, collection, name) references in one round trip
+async def validate_object_ids(*refs):
+    obj_ids = []
+    for id_str, _, name in refs:
+        try:
+            obj_ids.append(to_object_id(id_str))
+        except (InvalidId, TypeError):
+            raise HTTPException(status_code=400, detail=f"Invalid {name} ID format")
+
+    # Each branch emits the index of its reference only if the document exists
+    pipelines = [
+        [
+            {"$match": {"_id": obj_id}},
+            {"$project": {"_id": 0, "ref": {"$literal": index}}}
+        ]
+        for index, obj_id in enumerate(obj_ids)
+    ]
+    pipeline = pipelines[0] + [
+        {"$unionWith": {"coll": collection.name, "pipeline": branch}}
+        for (_, collection, _), branch in zip(refs[1:], pipelines[1:])
+    ]
+
+    found = await refs[0][1].aggregate(pipeline).to_list(len(refs))
+    found = {doc["ref"] for doc in found}
+
+    for index, (_, _, name) in enumerate(refs):
+        if index not in found:
+            raise HTTPException(status_code=400, detail=f"{name} not found")
+
+    return obj_ids
+
+# Validate a batch of references to one collection with a single $in query,
+# returning a mapping of each ID string to its ObjectId
+async def validate_object_id_batch(id_strs, collection, name: str):
+    obj_ids = {}
+    for id_str in id_strs:
+        try:
+            obj_ids[id_str] = to_object_id(id_str)
+        except (InvalidId, TypeError):
+            raise HTTPException(status_code=400, detail=f"Invalid {name} ID format")
+
+    wanted = set(obj_ids.values())
+    found = await collection.find(
+        {"_id": {"$in": list(wanted)}}, projection={"_id": 1}
+    ).to_list(len(wanted))
+
+    missing = wanted - {doc["_id"] for doc in found}
+    if missing:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{name} not found: {', '.join(sorted(map(str, missing)))}"
+        )
+
+    return obj_ids
+
+# Stream one page in _id order. MongoDB stringifies _id itself, and the batch
+# size matches the limit so the page arrives without a getMore round trip
+async def list_page(collection, after: Optional[ObjectId], limit: int):
+    pipeline = [
+        {"$match": {"_id": {"$gt": after}} if after else {}},
+        {"$sort": {"_id": 1}},
+        {"$limit": limit},
+        {"$addFields": {"_id": {"$toString": "$_id"}}}
+    ]
+    cursor = collection.aggregate(pipeline, batchSize=limit)
+
+    # Run the query before the response starts, so a failure still produces
+    # an error status. With batchSize equal to the limit, the whole page is
+    # then buffered in the cursor before the first byte is sent
+    try:
+        first = await cursor.next()
+    except StopAsyncIteration:
+        first = None
+
+    # Documents are encoded one at a time from the cursor's buffer
+    async def iter_json():
+        count = 0
+        last_id = None
+
+        yield b'{"data":['
+        if first is not None:
+            yield orjson.dumps(first, default=encode_bson_types)
+            count = 1
+            last_id = first["_id"]
+
+            async for doc in cursor:
+                yield b"," + orjson.dumps(doc, default=encode_bson_types)
+                count += 1
+                last_id = doc["_id"]
+
+        next_cursor = last_id if count == limit else None
+        yield b'],"next":' + orjson.dumps(next_cursor) + b"}"
+
+    return StreamingResponse(iter_json(), media_type="application/json")
@@ -0,0 +1,42 @@
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from pymongo.errors import WaitQueueTimeoutError
+
+from app.cache import redis_client
+from app.db import client, create_indexes
+from app.responses import MongoJSONResponse
+from app.routers import attendees, bookings, events, uploads, venues
+from app.storage import open_s3_client
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Establish the MongoDB connection before serving the first request
+    await client.admin.command("ping")
+    await create_indexes()
+
+    async with open_s3_client():
+        yield
+
+    client.close()
+    if redis_client:
+        await redis_client.aclose()
+
+app = FastAPI(
+    title="Event Management API",
+    description="RESTful API for managing events, venues, attendees, bookings and media",
+    version="1.0.0",
+    default_response_class=MongoJSONResponse,
+    lifespan=lifespan
+)
+
+# Every pooled MongoDB connection stayed busy for waitQueueTimeoutMS
+@app.exception_handler(WaitQueueTimeoutError)
+async def pool_exhausted_handler(request: Request, exc: WaitQueueTimeoutError):
+    return JSONResponse(status_code=503, content={"detail": "Database busy, try again"})
+
+app.include_router(events.router)
+app.include_router(venues.router)
+app.include_router(attendees.router)
+app.include_router(bookings.router)
+app.include_router(uploads.router)
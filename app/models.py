@@ -0,0 +1,29 @@
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+
+# Shared config: reject unknown fields and make request bodies immutable
+class RequestModel(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+class Event(RequestModel):
+    name: str
+    description: str
+    date: str
+    venue_id: str
+    max_attendees: int
+
+class Attendee(RequestModel):
+    name: str
+    email: str
+    phone: Optional[str] = None
+
+class Venue(RequestModel):
+    name: str
+    address: str
+    capacity: int
+
+class Booking(RequestModel):
+    event_id: str
+    attendee_id: str
+    ticket_type: str
+    quantity: int
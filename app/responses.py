@@ -0,0 +1,18 @@
+import orjson
+from bson import ObjectId
+from fastapi.responses import ORJSONResponse
+
+def encode_bson_types(obj):
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+# orjson-backed response that also encodes ObjectIds, so raw MongoDB
+# documents can be returned without a Python post-processing pass
+class MongoJSONResponse(ORJSONResponse):
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            default=encode_bson_types,
+            option=orjson.OPT_NON_STR_KEYS
+        )
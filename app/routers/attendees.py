@@ -0,0 +1,78 @@
+from fastapi import APIRouter, HTTPException
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.cache import cached_get, invalidate_cached
+from app.db import db
+from app.dependencies import AttendeeId, PageCursor, PageLimit
+from app.helpers import list_page
+from app.models import Attendee
+from app.routing import ORJSONRoute
+
+# Attendees Endpoints
+router = APIRouter(prefix="/attendees", tags=["attendees"], route_class=ORJSONRoute)
+
+# Create an attendee
+@router.post("")
+async def create_attendee(attendee: Attendee):
+    attendee_doc = attendee.model_dump()
+
+    try:
+        result = await db.attendees.insert_one(attendee_doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Attendee email already registered")
+
+    if not result.inserted_id:
+        raise HTTPException(status_code=500, detail="Failed to create attendee")
+    
+    return {
+        "message": "Attendee created",
+        "id": str(result.inserted_id)
+    }
+
+# Get all attendees
+@router.get("")
+async def get_attendees(after: PageCursor, limit: PageLimit = 50):
+    return await list_page(db.attendees, after, limit)
+
+# Get a single attendee
+@router.get("/{attendee_id}")
+async def get_attendee(attendee_obj_id: AttendeeId):
+    attendee = await cached_get(db.attendees, attendee_obj_id, "attendee")
+
+    if not attendee:
+        raise HTTPException(status_code=404, detail="Attendee not found")
+    
+    return attendee
+
+# Update an attendee
+@router.put("/{attendee_id}")
+async def update_attendee(attendee_obj_id: AttendeeId, attendee: Attendee):
+    try:
+        updated = await db.attendees.find_one_and_update(
+            {"_id": attendee_obj_id},
+            {"$set": attendee.model_dump()},
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Attendee email already registered")
+
+    if not updated:
+        raise HTTPException(status_code=404, detail="Attendee not found")
+
+    updated["_id"] = str(updated["_id"])
+    await invalidate_cached(attendee_obj_id, "attendee")
+    
+    return {"message": "Attendee updated", "attendee": updated}
+
+# Delete an attendee
+@router.delete("/{attendee_id}")
+async def delete_attendee(attendee_obj_id: AttendeeId):
+    result = await db.attendees.delete_one({"_id": attendee_obj_id})
+
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Attendee not found")
+
+    await invalidate_cached(attendee_obj_id, "attendee")
+    
+    return {"message": "Attendee deleted"}
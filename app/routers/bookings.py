@@ -0,0 +1,115 @@
+import asyncio
+from fastapi import APIRouter, HTTPException
+from pymongo import ReturnDocument
+
+from app.cache import cached_get, invalidate_cached
+from app.db import db
+from app.dependencies import BookingId, PageCursor, PageLimit, bulk_body
+from app.helpers import list_page, validate_object_id_batch, validate_object_ids
+from app.models import Booking
+from app.routing import ORJSONRoute
+
+# Bookings Endpoints
+router = APIRouter(prefix="/bookings", tags=["bookings"], route_class=ORJSONRoute)
+
+# Create a booking
+@router.post("")
+async def create_booking(booking: Booking):
+    event_obj_id, attendee_obj_id = await validate_object_ids(
+        (booking.event_id, db.events, "Event"),
+        (booking.attendee_id, db.attendees, "Attendee")
+    )
+
+    booking_doc = booking.model_dump()
+    booking_doc["event_id"] = str(event_obj_id)
+    booking_doc["attendee_id"] = str(attendee_obj_id)
+
+    result = await db.bookings.insert_one(booking_doc)
+
+    if not result.inserted_id:
+        raise HTTPException(status_code=500, detail="Failed to create booking")
+
+    return {
+        "message": "Booking created",
+          "id": str(result.inserted_id)
+    }
+
+# Create several bookings in one write
+@router.post("/bulk")
+async def create_bookings_bulk(bookings: bulk_body(Booking)):
+    event_obj_ids, attendee_obj_ids = await asyncio.gather(
+        validate_object_id_batch(
+            {booking.event_id for booking in bookings}, db.events, "Event"
+        ),
+        validate_object_id_batch(
+            {booking.attendee_id for booking in bookings}, db.attendees, "Attendee"
+        )
+    )
+
+    booking_docs = []
+    for booking in bookings:
+        booking_doc = booking.model_dump()
+        booking_doc["event_id"] = str(event_obj_ids[booking.event_id])
+        booking_doc["attendee_id"] = str(attendee_obj_ids[booking.attendee_id])
+        booking_docs.append(booking_doc)
+
+    result = await db.bookings.insert_many(booking_docs, ordered=False)
+
+    return {
+        "message": "Bookings created",
+        "ids": [str(inserted_id) for inserted_id in result.inserted_ids]
+    }
+
+# Get all bookings
+@router.get("")
+async def get_bookings(after: PageCursor, limit: PageLimit = 50):
+    return await list_page(db.bookings, after, limit)
+
+# Get a single booking
+@router.get("/{booking_id}")
+async def get_booking(booking_obj_id: BookingId):
+    booking = await cached_get(db.bookings, booking_obj_id, "booking")
+
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    return booking
+
+# Update a booking
+@router.put("/{booking_id}")
+async def update_booking(booking_obj_id: BookingId, booking: Booking):
+    # Validate new event and attendee references
+    event_obj_id, attendee_obj_id = await validate_object_ids(
+        (booking.event_id, db.events, "Event"),
+        (booking.attendee_id, db.attendees, "Attendee")
+    )
+
+    update_doc = booking.model_dump()
+    update_doc["event_id"] = str(event_obj_id)
+    update_doc["attendee_id"] = str(attendee_obj_id)
+    
+    updated = await db.bookings.find_one_and_update(
+        {"_id": booking_obj_id},
+        {"$set": update_doc},
+        return_document=ReturnDocument.AFTER
+    )
+
+    if not updated:
+        raise HTTPException(status_code=404, detail="Booking not found")
+
+    updated["_id"] = str(updated["_id"])
+    await invalidate_cached(booking_obj_id, "booking")
+    
+    return {"message": "Booking updated", "booking": updated}
+
+# Delete a booking
+@router.delete("/{booking_id}")
+async def delete_booking(booking_obj_id: BookingId):
+    result = await db.bookings.delete_one({"_id": booking_obj_id})
+
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Booking not found")
+
+    await invalidate_cached(booking_obj_id, "booking")
+    
+    return {"message": "Booking deleted"}
@@ -0,0 +1,107 @@
+from fastapi import APIRouter, HTTPException
+from pymongo import ReturnDocument
+
+from app.cache import cached_get, invalidate_cached
+from app.db import db
+from app.dependencies import EventId, PageCursor, PageLimit, bulk_body
+from app.helpers import list_page, validate_object_id, validate_object_id_batch
+from app.models import Event
+from app.routing import ORJSONRoute
+
+# Event Endpoints
+router = APIRouter(prefix="/events", tags=["events"], route_class=ORJSONRoute)
+
+# Create an event
+@router.post("")
+async def create_event(event: Event):
+    venue_obj_id = await validate_object_id(
+        event.venue_id, db.venues, "Venue"
+    )
+
+    event_doc = event.model_dump()
+    event_doc["venue_id"] = str(venue_obj_id)
+
+    result = await db.events.insert_one(event_doc)
+
+    if not result.inserted_id:
+        raise HTTPException(status_code=500, detail="Failed to create event")
+
+    return {
+        "message": "Event created",
+        "id": str(result.inserted_id)
+    }
+
+# Create several events in one write
+@router.post("/bulk")
+async def create_events_bulk(events: bulk_body(Event)):
+    venue_obj_ids = await validate_object_id_batch(
+        {event.venue_id for event in events}, db.venues, "Venue"
+    )
+
+    event_docs = []
+    for event in events:
+        event_doc = event.model_dump()
+        event_doc["venue_id"] = str(venue_obj_ids[event.venue_id])
+        event_docs.append(event_doc)
+
+    result = await db.events.insert_many(event_docs, ordered=False)
+
+    return {
+        "message": "Events created",
+        "ids": [str(inserted_id) for inserted_id in result.inserted_ids]
+    }
+
+# Get all events
+@router.get("")
+async def get_events(after: PageCursor, limit: PageLimit = 50):
+    return await list_page(db.events, after, limit)
+
+# Get a single event
+@router.get("/{event_id}")
+async def get_event(event_obj_id: EventId):
+    event = await cached_get(db.events, event_obj_id, "event")
+
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    
+    return event
+
+# Update an event
+@router.put("/{event_id}")
+async def update_event(event_obj_id: EventId, event: Event):
+    # Validate new venue reference
+    venue_obj_id = await validate_object_id(
+        event.venue_id, db.venues, "Venue"
+    )
+
+    update_doc = event.model_dump()
+    update_doc["venue_id"] = str(venue_obj_id)
+
+    # Returns the updated document in the same round trip for the response.
+    # The cache is invalidated rather than overwritten, since concurrent
+    # updates could otherwise leave an older document cached
+    updated = await db.events.find_one_and_update(
+        {"_id": event_obj_id},
+        {"$set": update_doc},
+        return_document=ReturnDocument.AFTER
+    )
+
+    if not updated:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    updated["_id"] = str(updated["_id"])
+    await invalidate_cached(event_obj_id, "event")
+    
+    return {"message": "Event updated", "event": updated}
+
+# Delete an event
+@router.delete("/{event_id}")
+async def delete_event(event_obj_id: EventId):
+    result = await db.events.delete_one({"_id": event_obj_id})
+
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    await invalidate_cached(event_obj_id, "event")
+    
+    return {"message": "Event deleted"}
@@ -0,0 +1,190 @@
+from datetime import datetime, timezone
+from typing import Optional
+from bson import ObjectId
+from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
+from gridfs.errors import NoFile
+
+from app.config import S3_BUCKET
+from app.db import db, event_posters, promo_videos, venue_photos
+from app.dependencies import FileId
+from app.helpers import validate_object_id
+from app.routing import body_limit_route, file_too_large
+from app.storage import redirect_to_s3, upload_to_s3
+
+# Uploads are streamed to GridFS in chunks of this size (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Upload size limits
+MAX_IMAGE_SIZE = 10 * 1024 * 1024
+MAX_VIDEO_SIZE = 500 * 1024 * 1024
+
+# Media types the upload endpoints can detect; anything else is only
+# ever served as a download
+MEDIA_TYPES = {"image/png", "image/jpeg", "video/mp4"}
+
+# PNG or JPEG
+def sniff_image(header: bytes) -> Optional[str]:
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    return None
+
+# MP4: the first box is "ftyp", after its 4-byte size
+def sniff_mp4(header: bytes) -> Optional[str]:
+    return "video/mp4" if header[4:8] == b"ftyp" else None
+
+# Reject mistyped uploads before any database work, returning the header
+# bytes and the content type they were sniffed as. Oversized bodies were
+# already rejected by the route class, before the form was parsed
+async def check_upload(file: UploadFile, sniff):
+    header = await file.read(12)
+    content_type = sniff(header)
+    if not content_type:
+        raise HTTPException(status_code=415, detail="Unsupported file type")
+
+    return header, content_type
+
+async def stream_to_gridfs(bucket, file: UploadFile, header: bytes, max_size: int, metadata: dict):
+    grid_in = bucket.open_upload_stream(file.filename, metadata=metadata)
+    size = 0
+
+    try:
+        chunk = header
+        while chunk:
+            # Content-Length may be missing or wrong, so enforce the limit here too
+            size += len(chunk)
+            if size > max_size:
+                raise file_too_large(max_size)
+
+            await grid_in.write(chunk)
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+    except Exception:
+        await grid_in.abort()
+        raise
+
+    await grid_in.close()
+    return grid_in._id
+
+# Stream a stored file back one GridFS chunk at a time
+async def stream_from_gridfs(bucket, file_id: ObjectId, name: str):
+    try:
+        grid_out = await bucket.open_download_stream(file_id)
+    except NoFile:
+        raise HTTPException(status_code=404, detail=f"{name} not found")
+
+    async def iter_chunks():
+        while chunk := await grid_out.readchunk():
+            yield chunk
+
+    content_type = (grid_out.metadata or {}).get("content_type")
+    headers = {
+        "Content-Length": str(grid_out.length),
+        "X-Content-Type-Options": "nosniff"
+    }
+
+    # Files stored before type sniffing carry the client-declared type,
+    # which must never be rendered inline
+    if content_type not in MEDIA_TYPES:
+        content_type = "application/octet-stream"
+        headers["Content-Disposition"] = "attachment"
+
+    return StreamingResponse(iter_chunks(), media_type=content_type, headers=headers)
+
+# Store an upload in S3 when configured, otherwise in the GridFS bucket
+async def save_upload(bucket, collection, file: UploadFile, header: bytes, max_size: int, metadata: dict):
+    if not S3_BUCKET:
+        return await stream_to_gridfs(bucket, file, header, max_size, metadata)
+
+    # The multipart parser has already spooled the file, so its size is known
+    if file.size is not None and file.size > max_size:
+        raise file_too_large(max_size)
+
+    await file.seek(0)
+    return await upload_to_s3(collection, file, metadata)
+
+# Files uploaded before S3 was configured are still served from GridFS
+async def serve_download(bucket, collection, file_id: ObjectId, name: str):
+    if S3_BUCKET:
+        response = await redirect_to_s3(collection, file_id)
+        if response:
+            return response
+    return await stream_from_gridfs(bucket, file_id, name)
+
+# Media Endpoints
+router = APIRouter(
+    tags=["media"],
+    route_class=body_limit_route({
+        "upload_event_poster": MAX_IMAGE_SIZE,
+        "upload_promo_video": MAX_VIDEO_SIZE,
+        "upload_venue_photo": MAX_IMAGE_SIZE
+    })
+)
+
+# Upload Event Poster (Image)
+@router.post("/upload_event_poster/{event_id}")
+async def upload_event_poster(event_id: str, file: UploadFile = File(...)):
+    header, content_type = await check_upload(file, sniff_image)
+    await validate_object_id(event_id, db.events, "Event")
+
+    file_id = await save_upload(event_posters, db.event_posters, file, header, MAX_IMAGE_SIZE, {
+        "event_id": event_id,
+        "content_type": content_type,
+        "uploaded_at": datetime.now(timezone.utc)
+    })
+
+    return {
+        "message": "Event poster uploaded", 
+        "id": str(file_id)
+    }
+
+
+# Upload Promotional Video
+@router.post("/upload_promo_video/{event_id}")
+async def upload_promo_video(event_id: str, file: UploadFile = File(...)):
+    header, content_type = await check_upload(file, sniff_mp4)
+    await validate_object_id(event_id, db.events, "Event")
+
+    file_id = await save_upload(promo_videos, db.promo_videos, file, header, MAX_VIDEO_SIZE, {
+        "event_id": event_id,
+        "content_type": content_type,
+        "uploaded_at": datetime.now(timezone.utc)
+    })
+
+    return {
+        "message": "Promotional video uploaded",
+        "id": str(file_id)
+    }
+
+# Upload Venue Photo
+@router.post("/upload_venue_photo/{venue_id}")
+async def upload_venue_photo(venue_id: str, file: UploadFile = File(...)):
+    header, content_type = await check_upload(file, sniff_image)
+    await validate_object_id(venue_id, db.venues, "Venue")
+
+    file_id = await save_upload(venue_photos, db.venue_photos, file, header, MAX_IMAGE_SIZE, {
+        "venue_id": venue_id,
+        "content_type": content_type,
+        "uploaded_at": datetime.now(timezone.utc)
+    })
+    
+    return {
+        "message": "Venue photo uploaded",
+        "id": str(file_id)
+    }
+
+# Get Event Poster
+@router.get("/event_poster/{file_id}")
+async def get_event_poster(file_obj_id: FileId):
+    return await serve_download(event_posters, db.event_posters, file_obj_id, "Event poster")
+
+# Get Promotional Video
+@router.get("/promo_video/{file_id}")
+async def get_promo_video(file_obj_id: FileId):
+    return await serve_download(promo_videos, db.promo_videos, file_obj_id, "Promotional video")
+
+# Get Venue Photo
+@router.get("/venue_photo/{file_id}")
+async def get_venue_photo(file_obj_id: FileId):
+    return await serve_download(venue_photos, db.venue_photos, file_obj_id, "Venue photo")
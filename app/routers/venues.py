@@ -0,0 +1,70 @@
+from fastapi import APIRouter, HTTPException
+from pymongo import ReturnDocument
+
+from app.cache import cached_get, invalidate_cached
+from app.db import db
+from app.dependencies import PageCursor, PageLimit, VenueId
+from app.helpers import list_page
+from app.models import Venue
+from app.routing import ORJSONRoute
+
+# Venues Endpoints
+router = APIRouter(prefix="/venues", tags=["venues"], route_class=ORJSONRoute)
+
+# Create a venue
+@router.post("")
+async def create_venue(venue: Venue):
+    venue_doc = venue.model_dump()
+    result = await db.venues.insert_one(venue_doc)
+    
+    if not result.inserted_id:
+        raise HTTPException(status_code=500, detail="Failed to create venue")
+    
+    return {
+        "message": "Venue created",
+        "id": str(result.inserted_id)
+    }
+
+# Get all venues
+@router.get("")
+async def get_venues(after: PageCursor, limit: PageLimit = 50):
+    return await list_page(db.venues, after, limit)
+
+# Get a single venue
+@router.get("/{venue_id}")
+async def get_venue(venue_obj_id: VenueId):
+    venue = await cached_get(db.venues, venue_obj_id, "venue")
+
+    if not venue:
+        raise HTTPException(status_code=404, detail="Venue not found")
+    
+    return venue
+
+# Update a venue
+@router.put("/{venue_id}")
+async def update_venue(venue_obj_id: VenueId, venue: Venue):
+    updated = await db.venues.find_one_and_update(
+        {"_id": venue_obj_id},
+        {"$set": venue.model_dump()},
+        return_document=ReturnDocument.AFTER
+    )
+
+    if not updated:
+        raise HTTPException(status_code=404, detail="Venue not found")
+
+    updated["_id"] = str(updated["_id"])
+    await invalidate_cached(venue_obj_id, "venue")
+    
+    return {"message": "Venue updated", "venue": updated}
+
+# Delete a venue
+@router.delete("/{venue_id}")
+async def delete_venue(venue_obj_id: VenueId):
+    result = await db.venues.delete_one({"_id": venue_obj_id})
+
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Venue not found")
+
+    await invalidate_cached(venue_obj_id, "venue")
+    
+    return {"message": "Venue deleted"}
@@ -0,0 +1,65 @@
+import orjson
+from fastapi import HTTPException, Request
+from fastapi.routing import APIRoute
+
+# Request whose JSON body is parsed by orjson instead of the stdlib json module
+class ORJSONRequest(Request):
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+# Route class for JSON APIs: bodies are decoded by orjson and then
+# validated by pydantic-core, so neither step runs in pure Python
+class ORJSONRoute(APIRoute):
+    def get_route_handler(self):
+        route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request):
+            return await route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+# Slack for multipart framing (boundaries, part headers) around the file
+MULTIPART_OVERHEAD = 64 * 1024
+
+def file_too_large(max_size: int):
+    return HTTPException(
+        status_code=413,
+        detail=f"File exceeds the {max_size // (1024 * 1024)} MB limit"
+    )
+
+# Route class enforcing per-endpoint body limits, keyed by endpoint name,
+# before the body is parsed: an oversized Content-Length is rejected without
+# reading anything, and a body without one is cut off once it passes the limit
+def body_limit_route(limits: dict):
+    class BodyLimitRoute(APIRoute):
+        def get_route_handler(self):
+            route_handler = super().get_route_handler()
+            max_size = limits.get(self.name)
+            if max_size is None:
+                return route_handler
+
+            max_body = max_size + MULTIPART_OVERHEAD
+
+            async def body_limit_route_handler(request: Request):
+                content_length = request.headers.get("content-length")
+                if content_length and content_length.isdigit() and int(content_length) > max_body:
+                    raise file_too_large(max_size)
+
+                received = 0
+
+                async def limited_receive():
+                    nonlocal received
+                    message = await request.receive()
+                    if message["type"] == "http.request":
+                        received += len(message.get("body", b""))
+                        if received > max_body:
+                            raise file_too_large(max_size)
+                    return message
+
+                return await route_handler(Request(request.scope, limited_receive))
+
+            return body_limit_route_handler
+
+    return BodyLimitRoute
@@ -0,0 +1,70 @@
+from contextlib import asynccontextmanager
+import aioboto3
+from bson import ObjectId
+from fastapi import UploadFile
+from fastapi.responses import RedirectResponse
+
+from app.config import S3_BUCKET, S3_ENDPOINT_URL, S3_URL_EXPIRY_SECONDS
+
+# Shared S3 client, opened by the app lifespan when S3_BUCKET is set.
+# Credentials come from the standard AWS environment variables
+s3 = None
+
+@asynccontextmanager
+async def open_s3_client():
+    global s3
+
+    if not S3_BUCKET:
+        yield
+        return
+
+    async with aioboto3.Session().client("s3", endpoint_url=S3_ENDPOINT_URL) as client:
+        s3 = client
+        try:
+            yield
+        finally:
+            s3 = None
+
+# Upload the file to object storage and keep only a reference in MongoDB
+async def upload_to_s3(collection, file: UploadFile, metadata: dict):
+    file_id = ObjectId()
+    key = f"{collection.name}/{file_id}"
+
+    # UploadFile.read() is awaitable and runs disk reads off the event loop
+    await s3.upload_fileobj(
+        file,
+        S3_BUCKET,
+        key,
+        ExtraArgs={"ContentType": metadata["content_type"]}
+    )
+
+    try:
+        await collection.insert_one({
+            "_id": file_id,
+            "key": key,
+            "filename": file.filename,
+            **metadata
+        })
+    except Exception:
+        # Don't leave an object behind that nothing references
+        await s3.delete_object(Bucket=S3_BUCKET, Key=key)
+        raise
+
+    return file_id
+
+# Redirect to a short-lived presigned URL so the bytes never pass through the API.
+# Returns None when the file has no S3 reference (e.g. it predates S3 storage)
+async def redirect_to_s3(collection, file_id: ObjectId):
+    doc = await collection.find_one(
+        {"_id": file_id, "key": {"$exists": True}}, projection={"key": 1}
+    )
+    if not doc:
+        return None
+
+    url = await s3.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": S3_BUCKET, "Key": doc["key"]},
+        ExpiresIn=S3_URL_EXPIRY_SECONDS
+    )
+
+    return RedirectResponse(url)
@@ -0,0 +1,10 @@
+import multiprocessing
+import os
+
+# Gunicorn settings for running the API with Uvicorn workers:
+#   gunicorn app.main:app -c gunicorn.conf.py
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn_worker.UvicornWorker"
+keepalive = 5
@@ -0,0 +1,24 @@
+import os
+import pytest
+
+# Integration tests run only when a real MongoDB (4.4+) is given explicitly
+INTEGRATION_MONGO_URI = os.getenv("MONGO_URI")
+
+# The app refuses to start without a URI; unit tests never connect to it,
+# since the client only opens connections on first use
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+# No context manager: the lifespan (ping, index creation) is not run
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+@pytest.fixture
+def mongo_uri():
+    if not INTEGRATION_MONGO_URI:
+        pytest.skip("MONGO_URI not set")
+    return INTEGRATION_MONGO_URI
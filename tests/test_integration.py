@@ -0,0 +1,67 @@
+import asyncio
+import orjson
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.helpers import list_page, validate_object_ids
+
+# Runs the check against a throwaway database that is dropped afterwards
+def run_with_db(mongo_uri, check):
+    async def main():
+        client = AsyncIOMotorClient(mongo_uri)
+        db = client[f"event_management_test_{ObjectId()}"]
+        try:
+            await check(db)
+        finally:
+            await client.drop_database(db.name)
+            client.close()
+
+    asyncio.run(main())
+
+async def read_page(response):
+    return orjson.loads(b"".join([chunk async for chunk in response.body_iterator]))
+
+def test_validate_object_ids_checks_every_reference(mongo_uri):
+    async def check(db):
+        event = await db.events.insert_one({"name": "Launch"})
+        attendee = await db.attendees.insert_one({"name": "Ada"})
+
+        obj_ids = await validate_object_ids(
+            (str(event.inserted_id), db.events, "Event"),
+            (str(attendee.inserted_id), db.attendees, "Attendee")
+        )
+        assert obj_ids == [event.inserted_id, attendee.inserted_id]
+
+        for refs, missing in [
+            ((str(event.inserted_id), str(ObjectId())), "Attendee"),
+            ((str(ObjectId()), str(attendee.inserted_id)), "Event")
+        ]:
+            with pytest.raises(HTTPException) as exc_info:
+                await validate_object_ids(
+                    (refs[0], db.events, "Event"),
+                    (refs[1], db.attendees, "Attendee")
+                )
+            assert exc_info.value.status_code == 400
+            assert exc_info.value.detail == f"{missing} not found"
+
+    run_with_db(mongo_uri, check)
+
+def test_list_page_follows_next_cursor(mongo_uri):
+    async def check(db):
+        result = await db.venues.insert_many([{"name": f"Hall {i}"} for i in range(3)])
+        ids = [str(inserted_id) for inserted_id in result.inserted_ids]
+
+        first = await read_page(await list_page(db.venues, None, 2))
+        assert [doc["_id"] for doc in first["data"]] == ids[:2]
+        assert first["next"] == ids[1]
+
+        second = await read_page(await list_page(db.venues, ObjectId(first["next"]), 2))
+        assert [doc["_id"] for doc in second["data"]] == ids[2:]
+        assert second["next"] is None
+
+        empty = await read_page(await list_page(db.venues, ObjectId(ids[2]), 2))
+        assert empty == {"data": [], "next": None}
+
+    run_with_db(mongo_uri, check)
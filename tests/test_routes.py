@@ -0,0 +1,63 @@
+from app.dependencies import MAX_BULK_SIZE
+
+EVENT = {
+    "name": "Launch",
+    "description": "Product launch",
+    "date": "2026-01-01",
+    "venue_id": "665f1c2e9b1e8a3d4c5b6a79",
+    "max_attendees": 100
+}
+
+def test_invalid_path_id_is_rejected(client):
+    response = client.get("/events/not-an-id")
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid event ID"}
+
+def test_invalid_path_id_uses_entity_name(client):
+    assert client.delete("/venues/123").json() == {"detail": "Invalid venue ID"}
+    assert client.get("/attendees/123").json() == {"detail": "Invalid attendee ID"}
+
+def test_path_id_keeps_its_name_in_openapi(client):
+    operation = client.get("/openapi.json").json()["paths"]["/events/{event_id}"]["get"]
+
+    assert [param["name"] for param in operation["parameters"]] == ["event_id"]
+
+def test_page_limit_is_bounded(client):
+    assert client.get("/events", params={"limit": 0}).status_code == 422
+    assert client.get("/events", params={"limit": 101}).status_code == 422
+
+def test_invalid_page_cursor_is_rejected(client):
+    response = client.get("/events", params={"after": "nope"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid pagination cursor"}
+
+def test_unknown_body_fields_are_rejected(client):
+    venue = {"name": "Hall", "address": "Main St", "capacity": 10, "extra": 1}
+
+    assert client.post("/venues", json=venue).status_code == 422
+
+def test_malformed_json_body_is_rejected(client):
+    response = client.post(
+        "/venues", content=b"{not json", headers={"content-type": "application/json"}
+    )
+
+    assert response.status_code == 422
+
+def test_invalid_booking_reference_is_rejected(client):
+    booking = {
+        "event_id": "bad",
+        "attendee_id": "665f1c2e9b1e8a3d4c5b6a79",
+        "ticket_type": "standard",
+        "quantity": 1
+    }
+
+    response = client.post("/bookings", json=booking)
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid Event ID format"}
+
+def test_bulk_body_length_is_bounded(client):
+    assert client.post("/events/bulk", json=[]).status_code == 422
+    assert client.post("/events/bulk", json=[EVENT] * (MAX_BULK_SIZE + 1)).status_code == 422
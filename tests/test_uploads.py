@@ -0,0 +1,77 @@
+from app.routers.uploads import MAX_IMAGE_SIZE, sniff_image, sniff_mp4
+from app.routing import MULTIPART_OVERHEAD
+
+PNG = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+JPEG = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01"
+MP4 = b"\x00\x00\x00\x18ftypmp42\x00\x00"
+
+EVENT_ID = "665f1c2e9b1e8a3d4c5b6a79"
+
+def test_sniff_image():
+    assert sniff_image(PNG) == "image/png"
+    assert sniff_image(JPEG) == "image/jpeg"
+    assert sniff_image(MP4) is None
+    assert sniff_image(b"<html><script>") is None
+    assert sniff_image(b"") is None
+
+def test_sniff_mp4():
+    assert sniff_mp4(MP4) == "video/mp4"
+    assert sniff_mp4(PNG) is None
+    assert sniff_mp4(b"") is None
+
+def test_unsupported_file_type_is_rejected(client):
+    response = client.post(
+        f"/upload_event_poster/{EVENT_ID}",
+        files={"file": ("poster.png", b"<html><script>alert(1)</script>", "image/png")}
+    )
+
+    assert response.status_code == 415
+
+def test_video_endpoint_rejects_images(client):
+    response = client.post(
+        f"/upload_promo_video/{EVENT_ID}",
+        files={"file": ("promo.mp4", PNG, "video/mp4")}
+    )
+
+    assert response.status_code == 415
+
+def test_invalid_owner_id_is_rejected(client):
+    response = client.post(
+        "/upload_venue_photo/not-an-id",
+        files={"file": ("photo.jpg", JPEG, "image/jpeg")}
+    )
+
+    assert response.status_code == 400
+
+def test_oversized_upload_is_rejected_by_content_length(client):
+    payload = PNG + b"\x00" * (MAX_IMAGE_SIZE + MULTIPART_OVERHEAD)
+
+    response = client.post(
+        f"/upload_event_poster/{EVENT_ID}",
+        files={"file": ("poster.png", payload, "image/png")}
+    )
+
+    assert response.status_code == 413
+
+def test_oversized_upload_without_content_length_is_rejected(client):
+    # A well-formed file part that never ends, sent without Content-Length
+    part_header = (
+        b"--limit\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="poster.png"\r\n'
+        b"Content-Type: image/png\r\n\r\n"
+    )
+    chunk = b"\x00" * (1 << 20)
+    chunks = MAX_IMAGE_SIZE // len(chunk) + 2
+
+    def body():
+        yield part_header + PNG
+        for _ in range(chunks):
+            yield chunk
+
+    response = client.post(
+        f"/upload_event_poster/{EVENT_ID}",
+        content=body(),
+        headers={"content-type": "multipart/form-data; boundary=limit"}
+    )
+
+    assert response.status_code == 413